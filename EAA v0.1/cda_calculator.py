@@ -4,11 +4,178 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import logging
+import math
+import concurrent.futures
+from datetime import date, datetime, time as time_of_day
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import os
+from kernels import njit, FASTMATH_FLAGS
+
+# pandas and matplotlib are imported where they're first needed so opening
+# the calculator window doesn't pay for them before a CSV is even chosen
+_mpl_configured = False
+
+
+def _load_matplotlib():
+    """Import the matplotlib pieces the plot window needs, configuring rcParams once"""
+    global _mpl_configured
+    import matplotlib as mpl
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    if not _mpl_configured:
+        # Let Agg simplify dense traces. No agg.path.chunksize: plotted series are
+        # capped at MAX_PLOT_POINTS, so chunking would never kick in
+        mpl.rcParams['path.simplify'] = True
+        mpl.rcParams['path.simplify_threshold'] = 1.0
+        _mpl_configured = True
+    return Figure, FigureCanvasTkAgg
+
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+except ImportError:  # tsdownsample is optional; fall back to plain min/max buckets
+    MinMaxLTTBDownsampler = None
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=FASTMATH_FLAGS)
+    def _window_stats(t, w, p, start, end):
+        """Weight-vs-time slope and mean pressure over start <= t <= end, in a single pass"""
+        # Welford-style running means and co-moments: no cancellation from large raw sums
+        n = 0
+        mt = 0.0
+        mw = 0.0
+        ctt = 0.0
+        ctw = 0.0
+        n_p = 0
+        sp = 0.0
+        for i in range(t.shape[0]):
+            ti = t[i]
+            if not (ti >= start and ti <= end):  # also skips NaN times
+                continue
+            pi = p[i]
+            if pi == pi:
+                sp += pi
+                n_p += 1
+            wi = w[i]
+            if wi == wi:
+                ti -= start  # shift time so epoch-style timestamps don't lose precision
+                n += 1
+                dt = ti - mt
+                mt += dt / n
+                mw += (wi - mw) / n
+                ctt += dt * (ti - mt)
+                ctw += dt * (wi - mw)
+        slope = np.nan
+        if n >= 2 and ctt != 0.0:
+            slope = ctw / ctt
+        p_mean = sp / n_p if n_p > 0 else np.nan
+        return slope, p_mean
+
+    @njit(cache=True)
+    def _valid_mask(t, p):
+        """True where neither time nor pressure is NaN, built in one pass"""
+        mask = np.empty(t.shape[0], dtype=np.bool_)
+        for i in range(t.shape[0]):
+            mask[i] = t[i] == t[i] and p[i] == p[i]
+        return mask
+
+    # Compile (or load from the on-disk cache) now so the first confirm doesn't stall.
+    # The column caches hand out read-only arrays, and numba compiles read-only and
+    # writable inputs separately, so warm up with read-only ones
+    _warmup = np.array([0.0, 1.0])
+    _warmup.setflags(write=False)
+    _window_stats(_warmup, _warmup, _warmup, 0.0, 1.0)
+    _valid_mask(_warmup, _warmup)
+    del _warmup
+else:
+    def _window_stats(t, w, p, start, end):
+        """Weight-vs-time slope and mean pressure over start <= t <= end"""
+        mask = (t >= start) & (t <= end)
+        
+        p_slice = p[mask]
+        p_slice = p_slice[~np.isnan(p_slice)]
+        p_mean = p_slice.mean() if len(p_slice) else np.nan
+        
+        t_slice = t[mask]
+        w_slice = w[mask]
+        valid = ~np.isnan(w_slice)
+        t_slice = t_slice[valid]
+        w_slice = w_slice[valid]
+        if len(t_slice) < 2:
+            return np.nan, p_mean
+        # Closed-form least-squares slope on centered data (no Vandermonde matrix / SVD)
+        tc = t_slice - t_slice.mean()
+        denom = np.dot(tc, tc)
+        if denom == 0.0:
+            return np.nan, p_mean
+        slope = np.dot(tc, w_slice - w_slice.mean()) / denom
+        return slope, p_mean
+
+    def _valid_mask(t, p):
+        """True where neither time nor pressure is NaN"""
+        # In-place ops so only one bool temporary is allocated
+        mask = np.isnan(t)
+        np.logical_or(mask, np.isnan(p), out=mask)
+        return np.logical_not(mask, out=mask)
+
+
+# Timestamp layouts seen in test-stand logs, tried before letting pandas guess per row
+DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+    "%m/%d/%Y %H:%M:%S.%f",
+    "%m/%d/%Y %H:%M:%S",
+    "%H:%M:%S.%f",
+    "%H:%M:%S",
+)
+
+
+def _guess_datetime_format(sample):
+    """Return the first known format that parses sample, or None"""
+    if not isinstance(sample, str):
+        return None
+    sample = sample.strip()
+    for fmt in DATETIME_FORMATS:
+        try:
+            datetime.strptime(sample, fmt)
+            return fmt
+        except ValueError:
+            continue
+    return None
+
+
+def _seconds_from_start(times):
+    """Seconds since the earliest timestamp as float64 (NaT -> NaN), without the .dt accessor"""
+    return (times - times.min()).to_numpy() / np.timedelta64(1, 's')
+
+
+def _minmax_indices(time_data, data, max_points):
+    """Indices of ~max_points samples of NaN-free data that keep its shape, in time order"""
+    n = len(data)
+    if n <= max_points:
+        return np.arange(n)
+    
+    # MinMaxLTTB picks the most representative points; it needs sorted time
+    if MinMaxLTTBDownsampler is not None and np.all(time_data[1:] >= time_data[:-1]):
+        return MinMaxLTTBDownsampler().downsample(time_data, data, n_out=max_points)
+    
+    # Split into equal buckets and keep the min and max sample of each
+    n_buckets = max(1, max_points // 2)
+    size = -(-n // n_buckets)  # ceil division
+    n_full = n // size
+    blocks = data[:n_full * size].reshape(n_full, size)
+    offsets = np.arange(n_full) * size
+    parts = [offsets + blocks.argmin(axis=1), offsets + blocks.argmax(axis=1)]
+    
+    # Leftover samples form one last, shorter bucket
+    if n_full * size < n:
+        tail = data[n_full * size:]
+        parts.append(n_full * size + np.array([tail.argmin(), tail.argmax()]))
+    
+    # np.unique sorts, so the min/max pairs come back in time order
+    return np.unique(np.concatenate(parts))
 
 
 class CdACalculatorWindow(tk.Toplevel):
@@ -17,6 +184,7 @@ class CdACalculatorWindow(tk.Toplevel):
     # Unit conversion constants
     LBS_TO_KG = 0.453592
     PSI_TO_PA = 6894.76
+    PA_TO_PSI = 1.0 / PSI_TO_PA
     CHAMBER_PRESSURE_PA = 3447380  # ~500 PSI chamber pressure
     
     def __init__(self, launcher):
@@ -30,6 +198,7 @@ class CdACalculatorWindow(tk.Toplevel):
         
         # Data storage
         self.df = None
+        self.columns = []  # Column names of df, built once per load
         self.time_col = None
         self.pressure_col = None
         self.weight_col = None
@@ -38,6 +207,16 @@ class CdACalculatorWindow(tk.Toplevel):
         self.calculated_mdot = None
         self.calculated_cda = None  # Store calculated CdA for set pressure calc
         
+        # Float64 copies of CSV columns, converted once per loaded file
+        self._col_cache = {}
+        self._time_np = None
+        self._time_sorted = False
+        self._time_cache_key = None  # (id(df), time_col) that _time_np was parsed from
+        self._window_avg_pressure = None  # (pressure_col, avg) from the last confirmed selection
+        
+        # Worker thread for CSV parsing, created on first load
+        self._io_pool = None
+        
         # StringVars for setpoint calculator (must be created before UI)
         self.setpoint_cda_var = tk.StringVar()
         self.setpoint_mdot_var = tk.StringVar()
@@ -110,7 +289,8 @@ class CdACalculatorWindow(tk.Toplevel):
         csv_inner = tk.Frame(csv_frame)
         csv_inner.pack(fill=tk.X, pady=5, padx=5)
         
-        tk.Button(csv_inner, text="Load CSV", command=self._load_csv, font=("Arial", 10)).pack(side=tk.LEFT, padx=10)
+        self.load_btn = tk.Button(csv_inner, text="Load CSV", command=self._load_csv, font=("Arial", 10))
+        self.load_btn.pack(side=tk.LEFT, padx=10)
         self.file_label = tk.Label(csv_inner, text="No file loaded", font=("Arial", 10), fg="gray")
         self.file_label.pack(side=tk.LEFT, padx=10)
         
@@ -284,41 +464,80 @@ class CdACalculatorWindow(tk.Toplevel):
         self.setpoint_result_pa.pack(pady=5)
         
     def _load_csv(self):
-        """Load a CSV file"""
+        """Load a CSV file on a worker thread so the window stays responsive"""
         path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv")])
         if not path:
             return
             
+        if self._io_pool is None:
+            self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            
+        self.load_btn.config(state=tk.DISABLED, text="Loading...")
+        future = self._io_pool.submit(self._read_csv, path)
+        self._poll_csv_load(path, future)
+        
+    @staticmethod
+    def _read_csv(path):
+        """Parse a CSV file (runs on the worker thread)"""
+        import pandas as pd
         try:
-            self.df = pd.read_csv(path, low_memory=False)
+            # pyarrow parses multithreaded; fall back to the C engine if it's missing or chokes
+            return pd.read_csv(path, engine='pyarrow')
+        except (ImportError, ValueError):
+            return pd.read_csv(path, low_memory=False)
+            
+    def _poll_csv_load(self, path, future):
+        """Wait for the worker without blocking Tk (Tk calls must stay on this thread)"""
+        if not future.done():
+            self.after(50, self._poll_csv_load, path, future)
+            return
+        self._on_csv_loaded(path, future)
+        
+    def _on_csv_loaded(self, path, future):
+        """Install a freshly parsed CSV and populate the column selectors"""
+        self.load_btn.config(state=tk.NORMAL, text="Load CSV")
+        try:
+            self.df = future.result()
+            self._col_cache.clear()
+            self._time_np = None
+            self._time_cache_key = None
+            self._window_avg_pressure = None
             self.file_label.config(text=f"Loaded: {os.path.basename(path)}", fg="black")
             
             # Populate column dropdowns
-            columns = list(self.df.columns)
-            self.time_combo.config(values=columns)
-            self.pressure_combo.config(values=columns)
-            self.weight_combo.config(values=columns)
+            self.columns = self.df.columns.tolist()
+            self.time_combo.config(values=self.columns)
+            self.pressure_combo.config(values=self.columns)
+            self.weight_combo.config(values=self.columns)
             
-            self._autodetect_columns(columns)
+            self._autodetect_columns(self.columns)
                         
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load CSV: {e}")
 
     def _autodetect_columns(self, columns):
         """Auto-detect common columns"""
-        for col in columns:
-            col_lower = col.lower()
-            if "time" in col_lower or col_lower == "t":
-                self.time_combo.set(col)
-                self.time_col = col
-            elif "pressure" in col_lower or "press" in col_lower:
-                if not self.pressure_combo.get():
-                    self.pressure_combo.set(col)
-                    self.pressure_col = col
-            elif "weight" in col_lower or "mass" in col_lower:
-                if not self.weight_combo.get():
-                    self.weight_combo.set(col)
-                    self.weight_col = col
+        import pandas as pd
+        names = pd.Index(columns).str.lower()
+        
+        # Each column gets at most one role: time, then pressure, then weight
+        time_mask = names.str.contains("time", regex=False) | (names == "t")
+        pressure_mask = names.str.contains("press", regex=False) & ~time_mask
+        weight_mask = names.str.contains("weight|mass") & ~time_mask & ~pressure_mask
+        
+        if time_mask.any():
+            # Last matching time column wins
+            col = columns[len(columns) - 1 - np.argmax(time_mask[::-1])]
+            self.time_combo.set(col)
+            self.time_col = col
+        if pressure_mask.any() and not self.pressure_combo.get():
+            col = columns[np.argmax(pressure_mask)]
+            self.pressure_combo.set(col)
+            self.pressure_col = col
+        if weight_mask.any() and not self.weight_combo.get():
+            col = columns[np.argmax(weight_mask)]
+            self.weight_combo.set(col)
+            self.weight_col = col
             
     def _open_plot_window(self):
         """Open a separate window for time selection with plot"""
@@ -345,14 +564,18 @@ class CdACalculatorWindow(tk.Toplevel):
             time_col, 
             pressure_col, 
             weight_col,
-            self._on_time_selection_confirmed
+            self._on_time_selection_confirmed,
+            self._get_numeric_col,
+            self._get_time_data_and_order
         )
         
-    def _on_time_selection_confirmed(self, start_time, end_time, mdot):
+    def _on_time_selection_confirmed(self, start_time, end_time, mdot, avg_pressure=None):
         """Callback when user confirms time selection in plot window"""
         self.start_time = start_time
         self.end_time = end_time
         self.calculated_mdot = mdot
+        # Mean of pressure_col over the window, computed in the same pass as mdot
+        self._window_avg_pressure = (self.pressure_col, avg_pressure) if avg_pressure is not None else None
         
         # Update display
         self.start_time_label.config(text=f"{start_time:.3f} s")
@@ -366,6 +589,9 @@ class CdACalculatorWindow(tk.Toplevel):
     def _on_time_col_changed(self, event=None):
         """Handle time column selection change"""
         self.time_col = self.time_combo.get()
+        self._time_np = None
+        self._time_cache_key = None
+        self._window_avg_pressure = None
         
     def _on_pressure_col_changed(self, event=None):
         """Handle pressure column selection change"""
@@ -417,7 +643,7 @@ class CdACalculatorWindow(tk.Toplevel):
             p_set_pa = delta_p_pa + manifold_p_pa
             
             # Convert to PSI
-            p_set_psi = p_set_pa / self.PSI_TO_PA
+            p_set_psi = p_set_pa * self.PA_TO_PSI
             
             # Display results
             self.setpoint_result_label.config(text=f"P_set = {p_set_psi:.1f} PSI")
@@ -435,21 +661,23 @@ class CdACalculatorWindow(tk.Toplevel):
             return
             
         try:
-            # Get numeric time data (handles datetime strings)
-            time_data = self._get_numeric_time_data()
-            if time_data is None:
-                messagebox.showerror("Error", "Could not parse time data.")
-                return
-                
-            pressure_data = pd.to_numeric(self.df[self.pressure_col], errors='coerce').values
-            
-            mask = (time_data >= self.start_time) & (time_data <= self.end_time)
+            cached = self._window_avg_pressure
+            if cached is not None and cached[0] == self.pressure_col:
+                # Already averaged while computing mdot for this selection
+                avg_pressure = cached[1]
+            else:
+                # Get numeric time data (handles datetime strings)
+                time_data = self._get_numeric_time_data()
+                if time_data is None:
+                    messagebox.showerror("Error", "Could not parse time data.")
+                    return
+                    
+                pressure_data = self._get_numeric_col(self.pressure_col)
+                avg_pressure = self._window_mean(time_data, pressure_data)
             
-            if not np.any(mask):
+            if avg_pressure is None:
                 messagebox.showerror("Error", "No data in selected time range.")
                 return
-                
-            avg_pressure = np.nanmean(pressure_data[mask])
             
             if which == "high":
                 self.p_high_var.set(f"{avg_pressure:.2f}")
@@ -459,25 +687,104 @@ class CdACalculatorWindow(tk.Toplevel):
         except Exception as e:
             messagebox.showerror("Error", f"Failed to calculate average: {e}")
     
+    def _get_numeric_col(self, col):
+        """Return a column as a float64 array, converting it only once per loaded CSV"""
+        values = self._col_cache.get(col)
+        if values is None:
+            values = self._to_float(col)
+            # Read-only whether or not pandas had to copy, so the numba kernels
+            # always see the one array type they were warmed up with
+            values.setflags(write=False)
+            self._col_cache[col] = values
+        return values
+    
+    def _to_float(self, col):
+        """Convert a column to float64, skipping element-wise coercion if it's already numeric"""
+        import pandas as pd
+        series = self.df[col]
+        if pd.api.types.is_numeric_dtype(series):
+            return series.to_numpy(dtype=np.float64, copy=False)
+        return pd.to_numeric(series, errors='coerce').to_numpy(dtype=np.float64, copy=False)
+    
+    def _window_mean(self, time_data, values):
+        """Average values between start_time and end_time, or None if the window is empty"""
+        if self._time_sorted:
+            # Sorted time: the window is a contiguous slice, no full-length mask needed
+            i0 = np.searchsorted(time_data, self.start_time, side='left')
+            i1 = np.searchsorted(time_data, self.end_time, side='right')
+            if i1 <= i0:
+                return None
+            return np.nanmean(values[i0:i1])
+        
+        mask = (time_data >= self.start_time) & (time_data <= self.end_time)
+        if not np.any(mask):
+            return None
+        return np.nanmean(values[mask])
+    
     def _get_numeric_time_data(self):
+        """Numeric time data for the selected time column, cached until the column or file changes"""
+        key = (id(self.df), self.time_col)
+        if self._time_cache_key != key:
+            time_data = self._parse_time_data()
+            if time_data is None:
+                return None
+            time_data.setflags(write=False)  # Same read-only array type as the column cache
+            self._time_np = time_data
+            # Pairwise compare rather than np.diff: no float temporary, NaNs count as unsorted
+            self._time_sorted = bool(np.all(time_data[1:] >= time_data[:-1]))
+            self._time_cache_key = key
+        return self._time_np
+    
+    def _get_time_data_and_order(self):
+        """Cached numeric time data plus whether it's sorted (both None/False if unparseable)"""
+        time_data = self._get_numeric_time_data()
+        return time_data, time_data is not None and self._time_sorted
+    
+    def _parse_time_data(self):
         """Convert time column to numeric values (handles datetime strings)"""
+        import pandas as pd
         time_col_data = self.df[self.time_col]
         
-        # Try numeric first
+        # Already typed - no coercion or string parsing needed
+        if pd.api.types.is_numeric_dtype(time_col_data):
+            return self._to_float(self.time_col)
+        if pd.api.types.is_datetime64_any_dtype(time_col_data):
+            return _seconds_from_start(time_col_data)
+        
+        # pyarrow reads HH:MM:SS columns as datetime.time and bare dates as datetime.date
+        # objects, which neither to_numeric nor the string formats below can parse
+        first = time_col_data.first_valid_index()
+        sample = time_col_data[first] if first is not None else None
+        if isinstance(sample, time_of_day):
+            return _seconds_from_start(pd.to_timedelta(time_col_data.astype(str), errors='coerce'))
+        if isinstance(sample, date):
+            return _seconds_from_start(pd.to_datetime(time_col_data, errors='coerce'))
+        
+        # Strings: try numeric first
         time_numeric = pd.to_numeric(time_col_data, errors='coerce')
         
         if time_numeric.isna().all():
-            # Try datetime
+            # Try datetime - with a known format pandas parses in one vectorized pass
             try:
-                time_dt = pd.to_datetime(time_col_data, errors='coerce')
+                # A known format (guessed from one row) and ISO8601 both parse in one vectorized
+                # pass; 'mixed' (per-row guessing) is the last resort and is used as-is
+                fmt = _guess_datetime_format(sample)
+                candidates = ('ISO8601', 'mixed') if fmt is None else (fmt, 'ISO8601', 'mixed')
+                n_null = time_col_data.isna().sum()
+                for candidate in candidates:
+                    time_dt = pd.to_datetime(time_col_data, format=candidate, errors='coerce', cache=True)
+                    # Accept a format only if it parsed every non-null row (e.g. isoformat()
+                    # drops '.%f' on whole seconds, so fractional and whole seconds mix)
+                    if time_dt.isna().sum() == n_null:
+                        break
                 if time_dt.isna().all():
                     return None
                 # Convert to seconds from start
-                return (time_dt - time_dt.min()).dt.total_seconds().values
+                return _seconds_from_start(time_dt)
             except Exception:
                 return None
         else:
-            return time_numeric.values
+            return time_numeric.to_numpy(dtype=np.float64, copy=False)
     
     def _set_ambient_pressure(self):
         """Set P_low to ambient pressure (14.7 PSI)"""
@@ -502,9 +809,8 @@ class CdACalculatorWindow(tk.Toplevel):
         
         tk.Label(dialog, text="Select the pressure column for P_low:", font=("Arial", 11)).pack(pady=10)
         
-        columns = list(self.df.columns)
         col_var = tk.StringVar()
-        col_menu = ttk.Combobox(dialog, textvariable=col_var, values=columns, state="readonly", width=35)
+        col_menu = ttk.Combobox(dialog, textvariable=col_var, values=self.columns, state="readonly", width=35)
         col_menu.pack(pady=10)
         
         def apply_column():
@@ -519,15 +825,13 @@ class CdACalculatorWindow(tk.Toplevel):
                     messagebox.showerror("Error", "Could not parse time data.")
                     return
                     
-                p_low_data = pd.to_numeric(self.df[col], errors='coerce').values
+                p_low_data = self._get_numeric_col(col)
+                avg_p_low = self._window_mean(time_data, p_low_data)
                 
-                mask = (time_data >= self.start_time) & (time_data <= self.end_time)
-                
-                if not np.any(mask):
+                if avg_p_low is None:
                     messagebox.showerror("Error", "No data in selected time range.")
                     return
                     
-                avg_p_low = np.nanmean(p_low_data[mask])
                 self.p_low_var.set(f"{avg_p_low:.2f}")
                 dialog.destroy()
             except Exception as e:
@@ -566,7 +870,7 @@ class CdACalculatorWindow(tk.Toplevel):
                 return
                 
             # Calculate CdA = mdot / sqrt(2 * rho * delta_p)
-            cda = mdot / np.sqrt(2 * rho * delta_p)
+            cda = mdot / math.sqrt(2.0 * rho * delta_p)
             
             # Store for setpoint calculator
             self.calculated_cda = cda
@@ -595,7 +899,7 @@ class CdAPlotWindow(tk.Toplevel):
     LBS_TO_KG = 0.453592
     MAX_PLOT_POINTS = 2000  # Maximum points to plot for performance
     
-    def __init__(self, parent, df, time_col, pressure_col, weight_col, on_confirm_callback):
+    def __init__(self, parent, df, time_col, pressure_col, weight_col, on_confirm_callback, get_numeric_col, get_time_data):
         super().__init__(parent)
         self.title("Select Time Range")
         self.geometry("1000x700")
@@ -606,6 +910,8 @@ class CdAPlotWindow(tk.Toplevel):
         self.pressure_col = pressure_col
         self.weight_col = weight_col
         self.on_confirm_callback = on_confirm_callback
+        self.get_numeric_col = get_numeric_col  # Parent's cached float64 column lookup
+        self.get_time_data = get_time_data  # Parent's cached parsed time column and its sortedness
         
         self.start_time = None
         self.end_time = None
@@ -621,7 +927,10 @@ class CdAPlotWindow(tk.Toplevel):
         self.ax1 = None
         self.ax2 = None
         self.canvas = None
+        self.draw_cid = None
+        self._bg = None  # Plot background for blitting selection lines
         self.time_data_numeric = None
+        self.time_sorted = False
         
         self.protocol("WM_DELETE_WINDOW", self._on_close)
         
@@ -632,15 +941,21 @@ class CdAPlotWindow(tk.Toplevel):
         self.transient(parent)
         self.grab_set()
         
-    def _downsample_data(self, data, max_points):
-        """Downsample data array to max_points for efficient plotting"""
+    @staticmethod
+    def _downsample_data(time_data, data, max_points):
+        """Downsample data array to ~max_points, keeping each bucket's min and max so spikes survive"""
         n = len(data)
         if n <= max_points:
             return data, np.arange(n)
         
-        # Use every nth point
-        step = n // max_points
-        indices = np.arange(0, n, step)
+        # Bucket only the logged samples: a NaN would win its bucket's argmin/argmax and
+        # blank the trace (e.g. a weight column logged at a lower rate than pressure)
+        nan_rows = np.isnan(data)
+        if nan_rows.any():
+            keep = np.flatnonzero(~nan_rows)
+            indices = keep[_minmax_indices(time_data[keep], data[keep], max_points)]
+        else:
+            indices = _minmax_indices(time_data, data, max_points)
         return data[indices], indices
         
     def _build_ui(self):
@@ -689,35 +1004,23 @@ class CdAPlotWindow(tk.Toplevel):
         
     def _prepare_plot_data(self):
         """Prepare data for plotting, including handling time/numeric parsing"""
-        # Get time data - try numeric first, then datetime
-        time_col_data = self.df[self.time_col]
-
-        # Try to parse as numeric first
-        time_numeric = pd.to_numeric(time_col_data, errors='coerce')
-
-        if time_numeric.isna().all():
-            # All NaN means it's probably a datetime string - parse it
-            try:
-                time_dt = pd.to_datetime(time_col_data, errors='coerce')
-                if time_dt.isna().all():
-                    raise ValueError("Could not parse time column as numeric or datetime")
-                # Convert to seconds from start
-                time_data = (time_dt - time_dt.min()).dt.total_seconds().values
-            except Exception:
-                raise ValueError("Could not parse time column")
-        else:
-            time_data = time_numeric.values
+        # Numeric or datetime time column, parsed once per CSV by the parent
+        time_data, self.time_sorted = self.get_time_data()
+        if time_data is None:
+            raise ValueError("Could not parse time column")
 
         # Get pressure data
-        pressure_data = pd.to_numeric(self.df[self.pressure_col], errors='coerce').values
+        pressure_data = self.get_numeric_col(self.pressure_col)
 
-        # Store for later use in calculations
-        self.time_data_numeric = time_data.copy()
+        # Store for later use in calculations - shared with the parent's cache rather than copied
+        self.time_data_numeric = time_data
 
-        # Remove NaN values for plotting
-        valid_mask = ~(np.isnan(time_data) | np.isnan(pressure_data))
-        time_data = time_data[valid_mask]
-        pressure_data = pressure_data[valid_mask]
+        # Remove NaN values for plotting - skipped entirely for clean data
+        valid_mask = _valid_mask(time_data, pressure_data)
+        has_nan = not valid_mask.all()
+        if has_nan:
+            time_data = time_data[valid_mask]
+            pressure_data = pressure_data[valid_mask]
 
         if len(time_data) == 0:
             raise ValueError("No valid data points to plot")
@@ -725,8 +1028,9 @@ class CdAPlotWindow(tk.Toplevel):
         # Handle weight column if present
         weight_data = None
         if self.weight_col:
-            weight_data = pd.to_numeric(self.df[self.weight_col], errors='coerce').values
-            weight_data = weight_data[valid_mask]
+            weight_data = self.get_numeric_col(self.weight_col)
+            if has_nan:
+                weight_data = weight_data[valid_mask]
 
         return time_data, pressure_data, weight_data
 
@@ -735,31 +1039,24 @@ class CdAPlotWindow(tk.Toplevel):
         try:
             time_data, pressure_data, weight_data = self._prepare_plot_data()
             
-            # Downsample for plotting
-            n_points = len(time_data)
-            if n_points > self.MAX_PLOT_POINTS:
-                step = max(1, n_points // self.MAX_PLOT_POINTS)
-                plot_indices = np.arange(0, n_points, step)
-                time_plot = time_data[plot_indices]
-                pressure_plot = pressure_data[plot_indices]
-                if weight_data is not None:
-                    weight_plot = weight_data[plot_indices]
-                else:
-                    weight_plot = None
-            else:
-                time_plot = time_data
-                pressure_plot = pressure_data
-                weight_plot = weight_data
+            # Downsample for plotting (each series keeps its own extrema)
+            pressure_plot, p_idx = self._downsample_data(time_data, pressure_data, self.MAX_PLOT_POINTS)
+            time_plot = time_data[p_idx]
+            weight_plot = None
+            if weight_data is not None:
+                weight_plot, w_idx = self._downsample_data(time_data, weight_data, self.MAX_PLOT_POINTS)
+                weight_time_plot = time_data[w_idx]
                 
-            # Create figure with minimal overhead
-            plt.rcParams['path.simplify'] = True
-            plt.rcParams['path.simplify_threshold'] = 1.0
-            plt.rcParams['agg.path.chunksize'] = 10000
+            Figure, FigureCanvasTkAgg = _load_matplotlib()
             
+            # Create figure with minimal overhead
             if self.weight_col and weight_data is not None:
-                self.fig, (self.ax1, self.ax2) = plt.subplots(2, 1, figsize=(9, 5), sharex=True)
+                # Plain Figure (not pyplot) so it isn't kept alive by pyplot's figure manager
+                self.fig = Figure(figsize=(9, 5))
+                self.ax1, self.ax2 = self.fig.subplots(2, 1, sharex=True)
             else:
-                self.fig, self.ax1 = plt.subplots(1, 1, figsize=(9, 4))
+                self.fig = Figure(figsize=(9, 4))
+                self.ax1 = self.fig.subplots(1, 1)
                 self.ax2 = None
             
             # Plot pressure
@@ -771,7 +1068,7 @@ class CdAPlotWindow(tk.Toplevel):
             
             # Plot weight if available
             if self.weight_col and self.ax2 is not None and weight_plot is not None:
-                self.ax2.plot(time_plot, weight_plot, 'g-', linewidth=0.5, label='Weight')
+                self.ax2.plot(weight_time_plot, weight_plot, 'g-', linewidth=0.5, label='Weight')
                 self.ax2.set_xlabel('Time (s)', fontsize=10)
                 self.ax2.set_ylabel('Weight (lbs)', fontsize=10)
                 self.ax2.grid(True, alpha=0.3)
@@ -783,6 +1080,8 @@ class CdAPlotWindow(tk.Toplevel):
             
             # Embed in tkinter
             self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_container)
+            # Re-capture the blit background after every full draw (first paint, resize)
+            self.draw_cid = self.canvas.mpl_connect('draw_event', self._on_draw)
             self.canvas.draw()
             self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
             
@@ -822,9 +1121,9 @@ class CdAPlotWindow(tk.Toplevel):
             self._remove_lines()
             
             # Draw vertical line for start
-            self.start_line = self.ax1.axvline(x=x_click, color='green', linestyle='--', linewidth=1.5)
+            self.start_line = self.ax1.axvline(x=x_click, color='green', linestyle='--', linewidth=1.5, animated=True)
             if self.ax2:
-                self.start_line2 = self.ax2.axvline(x=x_click, color='green', linestyle='--', linewidth=1.5)
+                self.start_line2 = self.ax2.axvline(x=x_click, color='green', linestyle='--', linewidth=1.5, animated=True)
                 
         elif self.click_count == 2:
             # Second click - set end time
@@ -844,16 +1143,36 @@ class CdAPlotWindow(tk.Toplevel):
                 self.start_line2.set_xdata([self.start_time, self.start_time])
             
             # Draw vertical line for end
-            self.end_line = self.ax1.axvline(x=self.end_time, color='red', linestyle='--', linewidth=1.5)
+            self.end_line = self.ax1.axvline(x=self.end_time, color='red', linestyle='--', linewidth=1.5, animated=True)
             if self.ax2:
-                self.end_line2 = self.ax2.axvline(x=self.end_time, color='red', linestyle='--', linewidth=1.5)
+                self.end_line2 = self.ax2.axvline(x=self.end_time, color='red', linestyle='--', linewidth=1.5, animated=True)
             
             # Enable confirm button
             self.confirm_btn.config(state=tk.NORMAL)
             self.click_count = 0
             
-        # Efficient redraw - only draw what's needed
-        self.canvas.draw_idle()
+        # Blit only the selection lines instead of re-rendering the whole figure
+        self._blit_selection()
+        
+    def _on_draw(self, event):
+        """Cache the freshly drawn plot as the blit background"""
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_selection_lines()
+        
+    def _draw_selection_lines(self):
+        """Draw the (animated) selection lines onto the canvas"""
+        for line in [self.start_line, self.end_line, self.start_line2, self.end_line2]:
+            if line is not None:
+                line.axes.draw_artist(line)
+        
+    def _blit_selection(self):
+        """Restore the cached background and blit the selection lines on top"""
+        if self._bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self._draw_selection_lines()
+        self.canvas.blit(self.fig.bbox)
         
     def _remove_lines(self):
         """Remove all selection lines from plot"""
@@ -879,60 +1198,58 @@ class CdAPlotWindow(tk.Toplevel):
         
         self._remove_lines()
         if self.canvas is not None:
-            self.canvas.draw_idle()
+            self._blit_selection()
         
-    def _calculate_mdot(self):
-        """Calculate mass flow rate from weight slope using FULL data (not downsampled)"""
+    def _calculate_window_stats(self):
+        """Return (mdot kg/s, avg pressure PSI) over the selection using FULL data; None where unavailable"""
         if self.start_time is None or self.end_time is None:
-            return None
+            return None, None
             
         if not self.weight_col:
-            return None
+            return None, None
             
         try:
             # Use the stored numeric time data
-            if hasattr(self, 'time_data_numeric') and self.time_data_numeric is not None:
-                time_data = self.time_data_numeric
-            else:
-                return None
+            if self.time_data_numeric is None:
+                return None, None
                 
-            weight_data = pd.to_numeric(self.df[self.weight_col], errors='coerce').values
+            time_data = self.time_data_numeric
+            weight_data = self.get_numeric_col(self.weight_col)
+            pressure_data = self.get_numeric_col(self.pressure_col)
             
-            mask = (time_data >= self.start_time) & (time_data <= self.end_time)
+            if self.time_sorted:
+                # Sorted time: the window is a contiguous slice, so only it gets scanned
+                i0 = np.searchsorted(time_data, self.start_time, side='left')
+                i1 = np.searchsorted(time_data, self.end_time, side='right')
+                time_data = time_data[i0:i1]
+                weight_data = weight_data[i0:i1]
+                pressure_data = pressure_data[i0:i1]
             
-            if not np.any(mask) or np.sum(mask) < 2:
-                return None
-                
-            t_slice = time_data[mask]
-            w_slice = weight_data[mask]
-            
-            # Remove NaN values
-            valid = ~(np.isnan(t_slice) | np.isnan(w_slice))
-            t_slice = t_slice[valid]
-            w_slice = w_slice[valid]
+            # One pass over time/weight/pressure for both results
+            slope, avg_pressure = _window_stats(time_data, weight_data, pressure_data,
+                                                float(self.start_time), float(self.end_time))
+            # Hand back plain floats so the scalar CdA math downstream stays in Python/math
+            avg_pressure = None if np.isnan(avg_pressure) else float(avg_pressure)
             
-            if len(t_slice) < 2:
-                return None
-            
-            # Calculate slope using linear regression
-            slope, _ = np.polyfit(t_slice, w_slice, 1)
+            if not np.isfinite(slope):
+                return None, avg_pressure
             
             # mdot = -slope (positive mass flow out of decreasing tank)
             mdot_lbs = -slope
             
             # Convert to kg/s
-            mdot_kg = mdot_lbs * self.LBS_TO_KG
+            mdot_kg = float(mdot_lbs) * self.LBS_TO_KG
             
-            return mdot_kg
+            return mdot_kg, avg_pressure
             
         except Exception:
-            return None
+            return None, None
             
     def _on_confirm(self):
         """Confirm selection and close window"""
         if self.start_time is not None and self.end_time is not None:
-            mdot = self._calculate_mdot()
-            self.on_confirm_callback(self.start_time, self.end_time, mdot)
+            mdot, avg_pressure = self._calculate_window_stats()
+            self.on_confirm_callback(self.start_time, self.end_time, mdot, avg_pressure)
         self._cleanup_and_close()
         
     def _on_close(self):
@@ -941,21 +1258,29 @@ class CdAPlotWindow(tk.Toplevel):
         
     def _cleanup_and_close(self):
         """Properly cleanup matplotlib resources before closing"""
-        # Disconnect event handler first
-        if self.cid is not None and self.fig is not None:
-            try:
-                self.fig.canvas.mpl_disconnect(self.cid)
-            except Exception as e:
-                logging.warning(f"Error disconnecting canvas: {e}")
+        # Disconnect event handlers first
+        if self.fig is not None:
+            for cid in [self.cid, self.draw_cid]:
+                if cid is None:
+                    continue
+                try:
+                    self.fig.canvas.mpl_disconnect(cid)
+                except Exception as e:
+                    logging.warning(f"Error disconnecting canvas: {e}")
             self.cid = None
+            self.draw_cid = None
+        self._bg = None
             
-        # Close figure to release memory
+        # Clear figure and drop the canvas widget to release memory
         if self.fig is not None:
             try:
-                plt.close(self.fig)
+                self.fig.clear()
+                if self.canvas is not None:
+                    self.canvas.get_tk_widget().destroy()
             except Exception as e:
                 logging.warning(f"Error closing figure: {e}")
             self.fig = None
+            self.canvas = None
             
         # Release grab and destroy window
         try:
@@ -0,0 +1,65 @@
+# draco_window.py
+# Draco Pressure Loss Calculator window opened from the launcher
+
+import tkinter as tk
+from tkinter import ttk
+from navigation import NavigationMixin
+
+
+class DracoPressureLossWindow(tk.Toplevel, NavigationMixin):
+    """Draco Pressure Loss Calculator window (placeholder)"""
+    
+    def __init__(self, launcher):
+        super().__init__(launcher)
+        self.launcher = launcher
+        self.title("Draco Pressure Loss Calculator")
+        self.geometry("800x600")
+        
+        # Handle window close
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # Add navigation
+        nav_container = tk.Frame(self)
+        nav_container.pack(side=tk.TOP, fill=tk.X)
+        self._add_navigation(nav_container, launcher)
+        
+        # The placeholder content is built the first time the window is mapped;
+        # closing only withdraws the window, so later opens reuse it as-is
+        self._built = False
+        self.bind("<Map>", self._ensure_built)
+        
+    def _ensure_built(self, event=None):
+        """Build the placeholder UI on the window's first <Map>"""
+        # Child widgets' <Map> events also reach this Toplevel binding
+        if self._built:
+            return
+        self._built = True
+        self._build_placeholder()
+        
+    def _build_placeholder(self):
+        """Build placeholder UI"""
+        content_frame = tk.Frame(self)
+        content_frame.pack(expand=True, fill=tk.BOTH)
+        
+        # Title
+        title_label = ttk.Label(
+            content_frame,
+            text="Draco Pressure Loss Calculator",
+            font=self.launcher.fonts["page_title"]
+        )
+        title_label.pack(pady=50)
+        
+        # Placeholder text
+        placeholder_label = ttk.Label(
+            content_frame,
+            text="🚧 Coming Soon 🚧\n\nThis feature is under development.",
+            font=self.launcher.fonts["notice"],
+            foreground="gray",
+            justify="center"
+        )
+        placeholder_label.pack(pady=50)
+        
+    def _on_close(self):
+        """Handle window close"""
+        self.withdraw()
+        self.launcher.show_launcher()
@@ -1 +1,15 @@
 # handlers package
+# Handler modules pull in pandas/matplotlib, so each one is imported the first
+# time it's accessed as handlers.<name> instead of when the package loads (PEP 562)
+import importlib
+
+
+def __getattr__(name):
+    """Import the handlers.<name> submodule on first access"""
+    try:
+        return importlib.import_module(f".{name}", __name__)
+    except ModuleNotFoundError as e:
+        # Only a missing submodule is an AttributeError; a missing dependency inside it isn't
+        if e.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
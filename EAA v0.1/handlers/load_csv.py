@@ -15,6 +15,11 @@ def run(app):
         messagebox.showerror("Error", f"Failed to load: {e}")
         return
 
+    # The launcher's hotfire window only builds its analysis controls once there
+    # is data for them; the standalone main.py app builds them up front
+    build_controls = getattr(app, "_build_plot_controls", None)
+    if build_controls is not None:
+        build_controls()
     infer_columns(app)
 
     tgt = simpledialog.askfloat("Target Thrust", "Enter expected target thrust (lbf):", parent=app)
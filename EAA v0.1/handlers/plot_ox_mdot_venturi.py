@@ -4,10 +4,18 @@
 
 import numpy as np
 from utils import apply_extra_data
+from kernels import venturi_mdot, mdot_stats, moving_average, warm_up_venturi
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.figure import Figure
+from functools import partial
+
+
+# The numba kernels take a moment to compile; do it when the handler is first
+# imported (opening the window) rather than on the first Calculate click
+warm_up_venturi()
 
 
 def run(app):
@@ -37,6 +45,13 @@ class VenturiMdotWindow(tk.Toplevel):
     PSI_TO_PA = 6894.76
     IN2_TO_M2 = 0.00064516  # square inches to square meters
     
+    # Cleared figures from closed windows, reused instead of building new ones.
+    # Several windows can be open at once, but only one spare is kept so closing
+    # many of them doesn't leave their figures' memory held by the pool
+    _fig_pool = []
+    FIG_POOL_SIZE = 1
+    FIG_SIZE = (10, 4)  # inches
+    
     def __init__(self, app, propellant_type="Oxidizer"):
         super().__init__(app)
         self.app = app
@@ -55,6 +70,25 @@ class VenturiMdotWindow(tk.Toplevel):
         self.y_var = tk.StringVar(value="1.0")  # Expansion factor (1 for incompressible)
         self.rho_var = tk.StringVar(value="1141")  # Density in kg/m³ (default to LOX for oxidizer)
         
+        # Plot state, created on the first calculation and reused afterwards
+        self.fig = None
+        self.ax = None
+        self.canvas = None
+        self.raw_line = None
+        self.smoothed_line = None
+        self.time = None
+        self.mdot = None
+        self.mdot_cumsum = None
+        self.time_sorted = None
+        self.mdot_by_time = None
+        self.points = []
+        self.click_markers = []
+        self.avg_line = None
+        self.click_cid = None
+        self.draw_cid = None
+        self._bg = None  # Plot background for blitting the selection
+        
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         self._build_ui()
     
     def _build_ui(self):
@@ -159,7 +193,7 @@ class VenturiMdotWindow(tk.Toplevel):
                 btn = tk.Button(
                     density_inner, 
                     text=fluid, 
-                    command=lambda d=density: self.rho_var.set(str(d)),
+                    command=partial(self.rho_var.set, str(density)),
                     font=("Arial", 9)
                 )
                 btn.pack(side=tk.LEFT, padx=3)
@@ -175,10 +209,36 @@ class VenturiMdotWindow(tk.Toplevel):
         )
         calc_btn.pack(pady=15)
         
-        # Plot frame
+        # Plot frame: the canvas host sits above the controls, both shown on the first calculation
         self.plot_frame = tk.Frame(main_frame)
         self.plot_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
+        self.plot_canvas_host = tk.Frame(self.plot_frame)
+        self.plot_canvas_host.pack(fill=tk.BOTH, expand=True)
+        
+        # Controls frame (built once; packed when there's a plot to control)
+        self.plot_controls = tk.Frame(self.plot_frame)
+        
+        # Smoothing slider
+        self.smoothing_slider = tk.Scale(
+            self.plot_controls, from_=1, to=100, orient=tk.HORIZONTAL,
+            label="Smoothing", command=self._update_smoothing
+        )
+        self.smoothing_slider.set(1)
+        self.smoothing_slider.pack(side=tk.LEFT, padx=10)
+        
+        # Save button
+        save_btn = tk.Button(self.plot_controls, text="Save Plot", command=self._save_plot)
+        save_btn.pack(side=tk.LEFT, padx=10)
+        
+        # Average label
+        self.avg_label = tk.Label(
+            self.plot_controls,
+            text="Click two points on the plot to calculate average ṁ",
+            font=("Arial", 11)
+        )
+        self.avg_label.pack(side=tk.LEFT, padx=20)
+        
         # Result label
         self.result_label = tk.Label(
             main_frame,
@@ -226,157 +286,216 @@ class VenturiMdotWindow(tk.Toplevel):
             mask = apply_extra_data(self.app)
             ds = max(self.app.downsampling_slider.get(), 1)
             
-            # Get data
-            time = self.ctx.df[self.ctx.time_col][mask].iloc[::ds].values
-            p1_psi = self.ctx.df[p1_col][mask].iloc[::ds].values.astype(float)
-            p2_psi = self.ctx.df[p2_col][mask].iloc[::ds].values.astype(float)
-            
-            # Convert pressures to Pa
-            p1_pa = p1_psi * self.PSI_TO_PA
-            p2_pa = p2_psi * self.PSI_TO_PA
+            # Row positions after masking and downsampling, so each column is gathered in one step
+            if isinstance(mask, slice):
+                rows = np.arange(0, len(self.ctx.df), ds)
+            else:
+                rows = np.flatnonzero(mask)[::ds]
             
-            # Calculate pressure difference
-            delta_p = p1_pa - p2_pa
-            
-            # Handle negative pressure differences (set to 0 or NaN)
-            delta_p = np.maximum(delta_p, 0)
+            # Get data
+            time = self.ctx.df[self.ctx.time_col].to_numpy()[rows]
+            # to_numpy(dtype=...) is a no-op view for float64 columns, so the gather is the only copy
+            p1_psi = self.ctx.df[p1_col].to_numpy(dtype=np.float64)[rows]
+            p2_psi = self.ctx.df[p2_col].to_numpy(dtype=np.float64)[rows]
             
             # Calculate beta ratio squared
             beta_sq = (a2 / a1) ** 2
             
             # Venturi equation: ṁ = Cd * Y * A2 * sqrt(2 * rho * delta_p / (1 - beta²))
+            # Scalars are folded up front; PSI -> Pa rides along in c. Negative/NaN dP give 0
             denominator = 1 - beta_sq
-            mdot = cd * y * a2 * np.sqrt(2 * rho * delta_p / denominator)
-            
-            # Handle any NaN values
-            mdot = np.nan_to_num(mdot, nan=0.0)
-            
-            # Clear previous plot
-            for widget in self.plot_frame.winfo_children():
-                widget.destroy()
+            k = cd * y * a2
+            c = 2 * rho * self.PSI_TO_PA / denominator
+            mdot = venturi_mdot(p1_psi, p2_psi, k, c)
             
-            # Create plot
-            fig, ax = plt.subplots(figsize=(10, 4), dpi=100)
-            canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            # Build the figure on first use; later calculations only swap the line data
+            self._ensure_fig()
+            self.time = time
+            self.mdot = mdot
             
-            # Plot mdot
-            raw_line, = ax.plot(time, mdot, label="Raw Data", color="orange", alpha=0.4, linewidth=1)
-            smoothed_line, = ax.plot(time, mdot, label="Smoothed Data", color="orange", linewidth=2)
+            # Prefix sum so every smoothing window is O(N) regardless of its width
+            self.mdot_cumsum = np.concatenate(([0.0], np.cumsum(mdot)))
             
-            ax.set_xlabel("Time (s)")
-            ax.set_ylabel("Mass Flow Rate (kg/s)")
-            ax.set_title(f"{self.propellant_type} Mass Flow Rate from Venturi")
-            ax.legend()
-            ax.grid(True)
-            fig.tight_layout()
+            # Clicks binary-search time, so keep a time-ordered copy only if the CSV isn't monotonic
+            if np.all(time[1:] >= time[:-1]):
+                self.time_sorted, self.mdot_by_time = time, mdot
+            else:
+                order = np.argsort(time, kind='stable')
+                self.time_sorted, self.mdot_by_time = time[order], mdot[order]
             
-            # Variables for selecting average region
-            points = []
-            avg_line = None
+            # Drop any selection from the previous calculation
+            self._clear_selection()
+            self.avg_label.config(text="Click two points on the plot to calculate average ṁ")
             
-            def on_click(event):
-                nonlocal points, avg_line
-                if event.inaxes != ax:
-                    return
-                
-                # Reset points if more than two are selected
-                if len(points) == 2:
-                    points.clear()
-                    # Remove previous markers
-                    while len(ax.lines) > 2:
-                        ax.lines[-1].remove()
-                    if avg_line:
-                        avg_line.remove()
-                        avg_line = None
-                    canvas.draw()
-                
-                # Add the new point
-                points.append((event.xdata, event.ydata))
-                ax.plot(event.xdata, event.ydata, 'ro', markersize=8)
-                canvas.draw()
-                
-                # If two points are selected, calculate and display the average
-                if len(points) == 2:
-                    x1, _ = points[0]
-                    x2, _ = points[1]
-                    
-                    # Get indices for the selected time range
-                    idx1 = np.searchsorted(time, min(x1, x2))
-                    idx2 = np.searchsorted(time, max(x1, x2))
-                    
-                    # Calculate average mdot
-                    avg_mdot = np.mean(mdot[idx1:idx2+1])
-                    
-                    # Draw horizontal line showing average
-                    avg_line, = ax.plot([min(x1, x2), max(x1, x2)], [avg_mdot, avg_mdot], 
-                                       'r--', linewidth=2, label=f"Avg: {avg_mdot:.4f} kg/s")
-                    
-                    ax.legend()
-                    canvas.draw()
-                    
-                    # Update result label
-                    avg_label.config(text=f"Average ṁ in selected range: {avg_mdot:.4f} kg/s")
-            
-            # Smoothing function
-            def update_smoothing(val):
-                window = smoothing_slider.get()
-                if window > 1:
-                    smoothed_mdot = np.convolve(mdot, np.ones(window) / window, mode='same')
-                    smoothed_line.set_ydata(smoothed_mdot)
-                else:
-                    smoothed_line.set_ydata(mdot)
-                canvas.draw()
-            
-            # Save function
-            def save_plot():
-                file_path = filedialog.asksaveasfilename(
-                    defaultextension=".png",
-                    filetypes=[("PNG files", "*.png"), ("All files", "*.*")],
-                    title="Save Plot As"
-                )
-                if file_path:
-                    fig.savefig(file_path)
-                    messagebox.showinfo("Saved", f"Plot saved to {file_path}")
-            
-            # Connect click event
-            canvas.mpl_connect("button_press_event", on_click)
-            
-            # Controls frame
-            controls_frame = tk.Frame(self.plot_frame)
-            controls_frame.pack(fill=tk.X, pady=5)
-            
-            # Smoothing slider
-            smoothing_slider = tk.Scale(
-                controls_frame, from_=1, to=100, orient=tk.HORIZONTAL,
-                label="Smoothing", command=update_smoothing
-            )
-            smoothing_slider.set(1)
-            smoothing_slider.pack(side=tk.LEFT, padx=10)
-            
-            # Save button
-            save_btn = tk.Button(controls_frame, text="Save Plot", command=save_plot)
-            save_btn.pack(side=tk.LEFT, padx=10)
-            
-            # Average label
-            avg_label = tk.Label(
-                controls_frame,
-                text="Click two points on the plot to calculate average ṁ",
-                font=("Arial", 11)
-            )
-            avg_label.pack(side=tk.LEFT, padx=20)
+            self.raw_line.set_data(time, mdot)
+            self._update_smoothing()
+            self.ax.relim()
+            self.ax.autoscale_view()
             
             # Update result label with statistics
-            avg_mdot_overall = np.nanmean(mdot[mdot > 0])
-            max_mdot = np.nanmax(mdot)
+            avg_mdot_overall, max_mdot = mdot_stats(mdot)
             self.result_label.config(
                 text=f"Overall Avg: {avg_mdot_overall:.4f} kg/s | Max: {max_mdot:.4f} kg/s",
                 fg="green"
             )
             
-            canvas.draw()
+            self.canvas.draw_idle()
             
         except ValueError as e:
             messagebox.showerror("Input Error", f"Invalid input value: {e}")
         except Exception as e:
             messagebox.showerror("Error", f"Calculation failed: {e}")
+    
+    def _ensure_fig(self):
+        """Create the plot and its canvas once and show the controls; later calls reuse them"""
+        if self.fig is not None:
+            return
+        
+        # Create plot - plain Figure (not pyplot) so it isn't kept alive by pyplot's figure manager
+        self.fig = self._acquire_fig()
+        self.ax = self.fig.add_subplot()
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_canvas_host)
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # Empty lines; data is filled in by each calculation
+        self.raw_line, = self.ax.plot([], [], label="Raw Data", color="orange", alpha=0.4, linewidth=1)
+        self.smoothed_line, = self.ax.plot([], [], label="Smoothed Data", color="orange", linewidth=2)
+        
+        self.ax.set_xlabel("Time (s)")
+        self.ax.set_ylabel("Mass Flow Rate (kg/s)")
+        self.ax.set_title(f"{self.propellant_type} Mass Flow Rate from Venturi")
+        self.ax.legend()
+        self.ax.grid(True)
+        self.fig.tight_layout()
+        
+        # Connect click event, and re-capture the blit background after every full draw
+        self.click_cid = self.canvas.mpl_connect("button_press_event", self._on_click)
+        self.draw_cid = self.canvas.mpl_connect("draw_event", self._on_draw)
+        
+        self.plot_controls.pack(fill=tk.X, pady=5)
+    
+    @classmethod
+    def _acquire_fig(cls):
+        """Take a cleared figure from the pool, or build a new one"""
+        if cls._fig_pool:
+            fig = cls._fig_pool.pop()
+            # The previous window's canvas resized it; start from the default size again
+            fig.set_size_inches(cls.FIG_SIZE)
+            return fig
+        return Figure(figsize=cls.FIG_SIZE, dpi=100)
+    
+    def _on_close(self):
+        """Return the figure to the pool and close the window"""
+        if self.fig is not None:
+            # Callbacks live on the figure, so drop them before it goes back in the pool
+            for cid in (self.click_cid, self.draw_cid):
+                self.canvas.mpl_disconnect(cid)
+            self._bg = None
+            self.fig.clear()
+            self.canvas.get_tk_widget().destroy()
+            if len(self._fig_pool) < self.FIG_POOL_SIZE:
+                # Attach a bare canvas so the pooled figure no longer references the dead Tk one
+                FigureCanvasBase(self.fig)
+                self._fig_pool.append(self.fig)
+            self.fig = None
+            self.canvas = None
+        self.destroy()
+    
+    def _on_click(self, event):
+        """Select two points on the plot and show the average ṁ between them"""
+        if event.inaxes != self.ax:
+            return
+        
+        # Reset points if more than two are selected
+        legend_changed = False
+        if len(self.points) == 2:
+            legend_changed = self.avg_line is not None
+            self._clear_selection()
+        
+        # Add the new point (animated and not autoscaled, so it can be blitted over the cached plot)
+        self.points.append((event.xdata, event.ydata))
+        marker, = self.ax.plot(event.xdata, event.ydata, 'ro', markersize=8,
+                               animated=True, scalex=False, scaley=False)
+        self.click_markers.append(marker)
+        
+        # If two points are selected, calculate and display the average
+        if len(self.points) == 2:
+            x1, _ = self.points[0]
+            x2, _ = self.points[1]
+            
+            # Get indices for the selected time range
+            idx1 = np.searchsorted(self.time_sorted, min(x1, x2))
+            idx2 = np.searchsorted(self.time_sorted, max(x1, x2))
+            
+            # Calculate average mdot
+            avg_mdot = np.mean(self.mdot_by_time[idx1:idx2+1])
+            
+            # Draw horizontal line showing average
+            self.avg_line, = self.ax.plot([min(x1, x2), max(x1, x2)], [avg_mdot, avg_mdot], 
+                                          'r--', linewidth=2, label=f"Avg: {avg_mdot:.4f} kg/s",
+                                          animated=True, scalex=False, scaley=False)
+            self.ax.legend()
+            legend_changed = True
+            
+            # Update result label
+            self.avg_label.config(text=f"Average ṁ in selected range: {avg_mdot:.4f} kg/s")
+        
+        # The legend is part of the background, so only a legend change needs a full redraw
+        if legend_changed:
+            self.canvas.draw_idle()
+        else:
+            self._blit_selection()
+    
+    def _on_draw(self, event):
+        """Cache the freshly drawn plot as the blit background"""
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_selection()
+    
+    def _draw_selection(self):
+        """Draw the (animated) click markers and average line onto the canvas"""
+        for artist in self.click_markers + [self.avg_line]:
+            if artist is not None:
+                self.ax.draw_artist(artist)
+    
+    def _blit_selection(self):
+        """Restore the cached background and blit the selection on top"""
+        if self._bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self._draw_selection()
+        self.canvas.blit(self.fig.bbox)
+    
+    def _clear_selection(self):
+        """Remove the click markers and average line"""
+        for marker in self.click_markers:
+            marker.remove()
+        self.click_markers = []
+        if self.avg_line is not None:
+            self.avg_line.remove()
+            self.avg_line = None
+            self.ax.legend()
+        self.points = []
+    
+    def _update_smoothing(self, val=None):
+        """Redraw the smoothed line for the current slider window"""
+        if self.mdot is None:
+            return
+        window = self.smoothing_slider.get()
+        if window > 1:
+            smoothed_mdot = moving_average(self.mdot_cumsum, window)
+            self.smoothed_line.set_data(self.time, smoothed_mdot)
+        else:
+            self.smoothed_line.set_data(self.time, self.mdot)
+        self.canvas.draw_idle()
+    
+    def _save_plot(self):
+        """Save the current plot to an image file"""
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".png",
+            filetypes=[("PNG files", "*.png"), ("All files", "*.*")],
+            title="Save Plot As"
+        )
+        if file_path:
+            self.fig.savefig(file_path)
+            messagebox.showinfo("Saved", f"Plot saved to {file_path}")
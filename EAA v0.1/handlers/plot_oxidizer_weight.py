@@ -96,7 +96,7 @@ def run(app):
 
     # Add smoothing slider
     smoothing_slider = tk.Scale(plot_win, from_=1, to=100, orient=tk.HORIZONTAL,
-                                 label="Smoothing", command=lambda val: update_smoothing(val))
+                                 label="Smoothing", command=update_smoothing)
     smoothing_slider.set(1)
     smoothing_slider.place(relx=0, rely=0.9, anchor="sw")  # Bottom left corner
 
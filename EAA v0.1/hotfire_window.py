@@ -0,0 +1,269 @@
+# hotfire_window.py
+# Hotfire Data Analysis App window opened from the launcher
+
+import tkinter as tk
+from tkinter import ttk
+from functools import partial
+from navigation import NavigationMixin
+
+
+class HotfireAnalyzerAppWrapper(tk.Toplevel, NavigationMixin):
+    """Wrapper for the Hotfire Analyzer App with navigation"""
+    
+    def __init__(self, launcher, show=True):
+        super().__init__(launcher)
+        # Keep the window unmapped while the widgets are packed so it's laid out and shown once
+        self.withdraw()
+        self.launcher = launcher
+        self.title("Hotfire Data Analyzer")
+        self.geometry("1200x950")
+        
+        # Handle window close
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # Import and setup the original app content. Handler modules (and the
+        # pandas/matplotlib stack behind them) and instructions load on first click
+        from context import AnalyzerContext
+        
+        self.ctx = AnalyzerContext()
+        self.time_splicing_var = tk.BooleanVar()
+        self._controls_built = False  # Sliders, plot buttons and metrics wait for the first CSV
+        self._recalc_after_id = None  # Pending debounced metrics recalculation, if any
+        self._shown_metrics = None  # Text currently in the metrics widget
+        
+        # Add navigation at the top
+        nav_container = tk.Frame(self)
+        nav_container.pack(side=tk.TOP, fill=tk.X)
+        self._add_navigation(nav_container, launcher)
+        
+        # Build the original app widgets
+        self._build_hotfire_widgets()
+        
+        # Settle geometry in one pass, then map the finished window
+        # (unless the launcher is building it ahead of time, withdrawn)
+        self.update_idletasks()
+        if show:
+            self.deiconify()
+        
+    def _run_handler(self, name):
+        """Run handlers.<name>, importing it on first use"""
+        import handlers
+        getattr(handlers, name).run(self)
+        
+    def _show_instructions(self):
+        """Open the instructions window, importing the module on first use"""
+        import instructions
+        instructions.run(self)
+        
+    def _build_hotfire_widgets(self):
+        """Build the hotfire analyzer UI (same as original main.py)"""
+        # Frame for the logo and title
+        banner_frame = tk.Frame(self)
+        banner_frame.pack(side=tk.TOP, fill=tk.X, pady=20)
+
+        # Add logo to the top-left
+        try:
+            # Decoded and resized once per session by the launcher
+            logo_photo = self.launcher._get_logo((240, 75))
+            logo_label = ttk.Label(banner_frame, image=logo_photo)
+            logo_label.image = logo_photo
+            logo_label.pack(side=tk.LEFT, padx=10)
+        except FileNotFoundError:
+            print("Error: Logo file not found.")
+
+        # Title and developer credit
+        title_frame = tk.Frame(banner_frame)
+        title_frame.pack(side=tk.LEFT, padx=150, anchor=tk.CENTER)
+
+        title_label = ttk.Label(title_frame, text="Hotfire Data Analysis App", font=self.launcher.fonts["banner"])
+        title_label.pack(side=tk.TOP, pady=0)
+
+        developer_label = ttk.Label(title_frame, text="Developed by Caleb Stone", font=self.launcher.fonts["body"])
+        developer_label.pack(side=tk.TOP)
+
+        # Instructions button
+        instructions_button = ttk.Button(banner_frame, text="Instructions", command=self._show_instructions)
+        instructions_button.pack(side=tk.RIGHT, padx=50)
+
+        # Top frame for file-related actions
+        top = tk.Frame(self)
+        top.pack(side=tk.TOP, fill=tk.X, pady=10)
+
+        ttk.Button(top, text="Load CSV", command=partial(self._run_handler, "load_csv")).pack(side=tk.LEFT, padx=100)
+        
+        self.file_label = tk.Label(top, text="No file", fg="gray")
+        self.file_label.pack(side=tk.LEFT, padx=10)
+
+        # Stands in for the analysis controls until a CSV is loaded
+        self.controls_placeholder = ttk.Label(
+            self,
+            text="Load a CSV to show the plot and metrics controls.",
+            foreground="gray"
+        )
+        self.controls_placeholder.pack(side=tk.TOP, pady=50)
+
+    def _build_plot_controls(self):
+        """Build the sliders, plot buttons, time splicing and metrics widgets (once)"""
+        if self._controls_built:
+            return
+        self._controls_built = True
+        self.controls_placeholder.destroy()
+
+        # Sliders frame
+        sliders = tk.Frame(self)
+        sliders.pack(side=tk.TOP, fill=tk.X, pady=10)
+
+        downsample_frame = tk.Frame(sliders)
+        downsample_frame.pack(side=tk.LEFT, padx=275)
+        ttk.Label(downsample_frame, text="Downsample").pack(side=tk.LEFT)
+        self.downsampling_slider = tk.Scale(downsample_frame, from_=1, to=100, orient=tk.HORIZONTAL)
+        self.downsampling_slider.set(10)
+        self.downsampling_slider.pack(side=tk.LEFT)
+
+        ttk.Label(sliders, text="Extra Data %").pack(side=tk.LEFT, padx=5)
+        self.extra_data_slider = tk.Scale(sliders, from_=0, to=3, resolution=0.1, orient=tk.HORIZONTAL)
+        self.extra_data_slider.set(0)
+        self.extra_data_slider.pack(side=tk.LEFT)
+
+        # Quick plots title
+        ttk.Label(self, text="Quick Plots", font=self.launcher.fonts["heading"]).pack(side=tk.TOP, pady=10)
+
+        # Plot buttons
+        plots = tk.Frame(self)
+        plots.pack(side=tk.TOP, pady=20)
+
+        # One grid row per frame: Tk places the whole row in a single pass
+        plot_buttons = [
+            ("Thrust", "plot_thrust"),
+            ("Chamber Pressure", "plot_chamber_pressure"),
+            ("O/F Ratio", "plot_of_ratio"),
+            ("Fuel Tank Weight", "plot_fuel_weight"),
+            ("Oxidizer Tank Weight", "plot_oxidizer_weight"),
+        ]
+        for i, (label, handler) in enumerate(plot_buttons):
+            ttk.Button(plots, text=label, command=partial(self._run_handler, handler)).grid(row=0, column=i, padx=3)
+
+        plots2 = tk.Frame(self)
+        plots2.pack(side=tk.TOP, pady=10)
+
+        plot_buttons2 = [
+            ("Exhaust Velocity from Isp", "plot_ve_from_isp"),
+            ("Specific Impulse", "plot_isp"),
+            ("C* actual", "plot_c_star"),
+        ]
+        for i, (label, handler) in enumerate(plot_buttons2):
+            ttk.Button(plots2, text=label, command=partial(self._run_handler, handler)).grid(row=0, column=i, padx=3)
+
+        # Bottom frame
+        bottom = tk.Frame(self)
+        bottom.pack(side=tk.BOTTOM, fill=tk.X, pady=50)
+
+        explanation_label = ttk.Label(
+            bottom,
+            text=(
+                "This program uses thrust data to slice other data. Once thrust hits 50% of the target, "
+                "that data is then included. If you are getting errors or the data does not look right, "
+                "use the Test Data button to ensure you actually hit 50% of your target thrust."
+            ),
+            wraplength=800,
+            justify="center",
+            foreground="gray")
+        explanation_label.pack(side=tk.BOTTOM, pady=5)
+
+        ttk.Button(bottom, text="Test Data", command=partial(self._run_handler, "test_data")).pack(side=tk.BOTTOM, pady=10)
+        ttk.Button(bottom, text="Generate All Plots", command=partial(self._run_handler, "generate_all")).pack(side=tk.BOTTOM, pady=20)
+        ttk.Button(bottom, text="Custom Plot", command=partial(self._run_handler, "custom_plot")).pack(side=tk.BOTTOM, pady=10, padx=50)
+
+        # Time splicing frame
+        time_splicing_frame = tk.Frame(bottom)
+        time_splicing_frame.pack(side=tk.TOP, pady=10)
+
+        # Checkbox on its own row above the start/end entries and Apply button
+        time_splicing_checkbox = ttk.Checkbutton(
+            time_splicing_frame, text="Custom Time Splicing", variable=self.time_splicing_var,
+            command=self._on_splice_toggled
+        )
+        time_splicing_checkbox.grid(row=0, column=0, columnspan=5, pady=10)
+
+        ttk.Label(time_splicing_frame, text="Start Time (s):").grid(row=1, column=0, padx=5)
+        self.start_time_entry = tk.Entry(time_splicing_frame, width=10)
+        self.start_time_entry.grid(row=1, column=1, padx=5)
+
+        ttk.Label(time_splicing_frame, text="End Time (s):").grid(row=1, column=2, padx=5)
+        self.end_time_entry = tk.Entry(time_splicing_frame, width=10)
+        self.end_time_entry.grid(row=1, column=3, padx=5)
+
+        # Bridge UI names
+        self.custom_splice_var = self.time_splicing_var
+        self.custom_splice_start = self.start_time_entry
+        self.custom_splice_end = self.end_time_entry
+
+        self.apply_splice_btn = ttk.Button(
+            time_splicing_frame,
+            text="Apply Splice",
+            command=self._schedule_recalc,
+            state=tk.DISABLED
+        )
+        self.apply_splice_btn.grid(row=1, column=4, padx=10)
+
+        self.custom_splice_start.bind("<Return>", self._schedule_recalc)
+        self.custom_splice_end.bind("<Return>", self._schedule_recalc)
+
+        # Metrics text widget
+        self.metrics_text = tk.Text(self, height=6, state=tk.DISABLED, bg=self.cget("bg"), relief=tk.FLAT)
+        self.metrics_text.pack(fill=tk.X, padx=5, pady=5)
+
+        # Tcl command names for the widgets refreshed on every recalculation,
+        # so those updates go straight to tk.call without the configure wrappers
+        self._tkcall = self.tk.call
+        self._metrics_path = str(self.metrics_text)
+        self._apply_btn_path = str(self.apply_splice_btn)
+        self._sync_apply_state()
+        
+        bottom_frame = tk.Frame(self)
+        bottom_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=10)
+
+    def _sync_apply_state(self):
+        """Enable Apply Splice only while custom time splicing is checked"""
+        state = tk.NORMAL if self.custom_splice_var.get() else tk.DISABLED
+        self._tkcall(self._apply_btn_path, "configure", "-state", state)
+
+    def _on_splice_toggled(self):
+        """Checkbox command: update the Apply button, then queue a recalculation"""
+        self._sync_apply_state()
+        self._schedule_recalc()
+
+    def display_metrics(self):
+        """Display metrics in the text widget"""
+        text = "".join(f"{k}: {v}\n" for k, v in self.ctx.metrics.items())
+        if text == self._shown_metrics:
+            return
+        
+        # One replace instead of a delete plus an insert per metric
+        call, path = self._tkcall, self._metrics_path
+        call(path, "configure", "-state", "normal")
+        call(path, "replace", "1.0", "end", text)
+        call(path, "configure", "-state", "disabled")
+        self._shown_metrics = text
+
+    def _schedule_recalc(self, *_):
+        """Queue a metrics recalculation; the checkbox, Apply and both entries' <Return>
+        all land here, and a burst of them within 80 ms runs the recalculation once"""
+        if self._recalc_after_id is not None:
+            self.after_cancel(self._recalc_after_id)
+        self._recalc_after_id = self.after(80, self._do_recalc_metrics)
+
+    def _do_recalc_metrics(self):
+        """Recalculate metrics when slice controls change"""
+        self._recalc_after_id = None
+        tgt = getattr(self.ctx, "last_target_thrust", None)
+        if tgt is None:
+            return
+        from utils import compute_metrics
+        compute_metrics(self, tgt)
+        self.display_metrics()
+        
+    def _on_close(self):
+        """Handle window close"""
+        self.withdraw()
+        self.launcher.show_launcher()
@@ -0,0 +1,80 @@
+# kernels.py
+# Numeric kernels shared by the CdA calculator and the plot handlers.
+# Only NumPy (and numba when installed) is imported here, so loading it stays cheap
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to NumPy
+    njit = None
+
+# fastmath minus 'nnan'/'ninf', so the NaN checks in the kernels aren't optimized away
+FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True, fastmath=FASTMATH_FLAGS)
+    def venturi_mdot(p1_psi, p2_psi, k, c):
+        """mdot = k * sqrt(c * (P1 - P2)) in one pass; negative or NaN dP gives 0"""
+        out = np.empty(p1_psi.shape[0])
+        for i in prange(p1_psi.shape[0]):
+            dp = p1_psi[i] - p2_psi[i]
+            if dp > 0.0:  # also false for NaN
+                out[i] = k * math.sqrt(c * dp)
+            else:
+                out[i] = 0.0
+        return out
+
+    @njit(cache=True, fastmath=FASTMATH_FLAGS)
+    def mdot_stats(mdot):
+        """(mean of positive mdot, max mdot) in a single pass, NaN where undefined"""
+        s = 0.0
+        c = 0
+        m = -np.inf
+        seen = False
+        for i in range(mdot.shape[0]):
+            v = mdot[i]
+            if v != v:
+                continue
+            seen = True
+            if v > m:
+                m = v
+            if v > 0.0:
+                s += v
+                c += 1
+        return (s / c if c > 0 else np.nan), (m if seen else np.nan)
+else:
+    def venturi_mdot(p1_psi, p2_psi, k, c):
+        """mdot = k * sqrt(c * (P1 - P2)); negative or NaN dP gives 0"""
+        # One allocation for dP, then everything in place
+        mdot = np.subtract(p1_psi, p2_psi)
+        np.maximum(mdot, 0.0, out=mdot)
+        mdot *= c
+        np.sqrt(mdot, out=mdot)
+        mdot *= k
+        return np.nan_to_num(mdot, nan=0.0, copy=False)
+
+    def mdot_stats(mdot):
+        """(mean of positive mdot, max mdot), NaN where undefined"""
+        positive = mdot[mdot > 0]
+        avg = positive.mean() if len(positive) else np.nan
+        return avg, (np.nanmax(mdot) if len(mdot) else np.nan)
+
+
+def moving_average(cumsum, window):
+    """Same result as np.convolve(x, np.ones(window) / window, mode='same'), in O(N) from x's prefix sum"""
+    n = len(cumsum) - 1
+    end = np.arange(n) + (window - 1) // 2 + 1
+    hi = np.minimum(end, n)
+    lo = np.maximum(end - window, 0)
+    return (cumsum[hi] - cumsum[lo]) / window
+
+
+def warm_up_venturi():
+    """Compile (or load from numba's on-disk cache) the venturi kernels ahead of the first Calculate"""
+    if njit is not None:
+        # Same signatures the handlers use: freshly gathered, writable float64 arrays
+        mdot_stats(venturi_mdot(np.zeros(2), np.zeros(2), 1.0, 1.0))
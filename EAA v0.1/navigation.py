@@ -0,0 +1,31 @@
+# navigation.py
+# Home navigation shared by the launcher's tool windows
+
+import tkinter as tk
+from tkinter import ttk
+
+
+class NavigationMixin:
+    """Mixin class to add home navigation button to windows"""
+    
+    def _add_navigation(self, parent_frame, launcher):
+        """Add home navigation button"""
+        nav_frame = tk.Frame(parent_frame)
+        nav_frame.pack(side=tk.TOP, fill=tk.X, pady=5)
+        
+        self.launcher = launcher
+        
+        # Home button only
+        home_btn = ttk.Button(
+            nav_frame,
+            text="🏠 Home",
+            style="Nav.TButton",
+            cursor="hand2",
+            command=self._go_home
+        )
+        home_btn.pack(side=tk.LEFT, padx=20)
+            
+    def _go_home(self):
+        """Return to launcher"""
+        self.withdraw()
+        self.launcher.show_launcher()
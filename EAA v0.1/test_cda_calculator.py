@@ -0,0 +1,86 @@
+# test_cda_calculator.py
+# Checks for the CdA calculator's CSV reading, time parsing, window stats and downsampling
+
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cda_calculator import CdACalculatorWindow, CdAPlotWindow, _window_stats
+
+
+def test_pyarrow_reads_clock_time_column(tmp_path):
+    """HH:MM:SS times come back from the pyarrow engine as datetime.time and still parse"""
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "hotfire.csv"
+    path.write_text("time,pressure,weight\n12:00:00,100,50\n12:00:01,101,49\n12:00:03,102,47\n")
+
+    df = CdACalculatorWindow._read_csv(str(path))
+    window = types.SimpleNamespace(df=df, time_col="time")
+
+    time_data = CdACalculatorWindow._parse_time_data(window)
+
+    assert time_data is not None
+    np.testing.assert_allclose(time_data, [0.0, 1.0, 3.0])
+
+
+@pytest.mark.parametrize("logged_every", [10, 97])
+def test_downsample_skips_nan_gaps(logged_every):
+    """A column with NaN gaps (logged slower than the time column) still plots a full trace"""
+    n = 100_000
+    time_data = np.arange(n, dtype=np.float64)
+    weight = np.linspace(100.0, 0.0, n)
+    if logged_every == 10:
+        weight[np.arange(n) % 10 != 0] = np.nan  # Only every 10th row logged
+    else:
+        weight[::logged_every] = np.nan  # Occasional dropped samples
+
+    values, indices = CdAPlotWindow._downsample_data(time_data, weight, 2000)
+
+    # The original fixed-stride downsampling, which plotted every finite sample it landed on
+    baseline = weight[::n // 2000]
+    assert np.isfinite(values).all()
+    assert np.isfinite(values).sum() >= min(np.isfinite(baseline).sum(), 1000)
+    assert len(values) > 1000
+    np.testing.assert_array_equal(values, weight[indices])
+    assert np.all(np.diff(indices) > 0)
+    # The extremes of the logged data survive downsampling
+    assert values.max() == np.nanmax(weight)
+    assert values.min() == np.nanmin(weight)
+
+
+@pytest.mark.parametrize("times, expected", [
+    (["12:00:00.500000", "12:00:01", "12:00:01.500000", "12:00:02"], [0.0, 0.5, 1.0, 1.5]),
+    (["12:00:00", "12:00:00.5", None, "12:00:01"], [0.0, 0.5, np.nan, 1.0]),
+    (["2024-01-01 12:00:00", "2024-01-01T12:00:00.5", "01/01/2024 12:00:01"], [0.0, 0.5, 1.0]),
+])
+def test_parse_time_mixes_fractional_and_whole_seconds(times, expected):
+    """A format guessed from the first row doesn't drop rows written in the other layout"""
+    window = types.SimpleNamespace(df=pd.DataFrame({"time": times}), time_col="time")
+
+    time_data = CdACalculatorWindow._parse_time_data(window)
+
+    np.testing.assert_allclose(time_data, expected)
+
+
+def test_window_stats_matches_baseline():
+    """Single-pass slope/mean equal the original polyfit and nanmean over the window, NaNs included"""
+    rng = np.random.default_rng(1)
+    n = 20_000
+    # Epoch-style timestamps, where unshifted sums would lose precision
+    time_data = 1.7e9 + np.arange(n) * 0.01
+    weight = 80.0 - 0.5 * (time_data - time_data[0]) + rng.normal(0.0, 0.05, n)
+    pressure = 400.0 + rng.normal(0.0, 5.0, n)
+    time_data[rng.choice(n, 100, replace=False)] = np.nan
+    weight[rng.choice(n, 500, replace=False)] = np.nan
+    pressure[rng.choice(n, 500, replace=False)] = np.nan
+    start, end = 1.7e9 + 40.0, 1.7e9 + 160.0
+
+    slope, p_mean = _window_stats(time_data, weight, pressure, start, end)
+
+    mask = (time_data >= start) & (time_data <= end)
+    valid = mask & ~np.isnan(weight)
+    expected_slope, _ = np.polyfit(time_data[valid], weight[valid], 1)
+    np.testing.assert_allclose(slope, expected_slope, rtol=1e-9)
+    np.testing.assert_allclose(p_mean, np.nanmean(pressure[mask]), rtol=1e-12)
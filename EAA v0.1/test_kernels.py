@@ -0,0 +1,50 @@
+# test_kernels.py
+# Checks the shared numeric kernels against the plain NumPy code they replaced
+
+import numpy as np
+import pytest
+
+from kernels import venturi_mdot, mdot_stats, moving_average
+
+
+def _baseline_mdot(p1_psi, p2_psi, k, c):
+    """The handlers' original element-wise venturi calculation"""
+    delta_p = np.maximum(p1_psi - p2_psi, 0)
+    return np.nan_to_num(k * np.sqrt(c * delta_p), nan=0.0)
+
+
+@pytest.fixture
+def pressures():
+    """Venturi inlet/throat pressures with NaN gaps and some negative dP"""
+    rng = np.random.default_rng(0)
+    n = 5000
+    p1 = 300.0 + rng.normal(0.0, 20.0, n)
+    p2 = 250.0 + rng.normal(0.0, 40.0, n)
+    p1[rng.choice(n, 200, replace=False)] = np.nan
+    p2[rng.choice(n, 200, replace=False)] = np.nan
+    return p1, p2
+
+
+def test_venturi_mdot_matches_baseline(pressures):
+    p1, p2 = pressures
+    np.testing.assert_allclose(venturi_mdot(p1, p2, 0.002, 1.5e4), _baseline_mdot(p1, p2, 0.002, 1.5e4))
+
+
+def test_mdot_stats_matches_baseline(pressures):
+    mdot = _baseline_mdot(*pressures, 0.002, 1.5e4)
+    mdot[::50] = np.nan  # The stats skip NaN even though venturi_mdot never produces one
+
+    avg, peak = mdot_stats(mdot)
+
+    np.testing.assert_allclose(avg, np.nanmean(mdot[mdot > 0]))
+    np.testing.assert_allclose(peak, np.nanmax(mdot))
+
+
+@pytest.mark.parametrize("window", [1, 2, 7, 50, 51])
+def test_moving_average_matches_convolve(pressures, window):
+    mdot = venturi_mdot(*pressures, 0.002, 1.5e4)
+    cumsum = np.concatenate(([0.0], np.cumsum(mdot)))
+
+    expected = np.convolve(mdot, np.ones(window) / window, mode='same')
+
+    np.testing.assert_allclose(moving_average(cumsum, window), expected, atol=1e-12)